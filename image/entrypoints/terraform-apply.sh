@@ -37,13 +37,14 @@ if [[ ! -v TMP_ENVIRONMENT_VAR_FILE ]]; then
 else
     terraform-upload-variable --workspace "$TF_WORKSPACE" --var-file "$TMP_ENVIRONMENT_VAR_FILE" --type "env"
 fi
-# Step 3: Upload terraform variables provided as direct input from variables.
+# Step 3: Collect terraform variables provided as direct input from variables.
+VAR_FILE_ARGS=()
 if [[ ! -v TMP_VAR_FILE ]]; then
     debug_log "Detected no input for [variables]"
 else
-    terraform-upload-variable --workspace "$TF_WORKSPACE" --var-file "$TMP_VAR_FILE"
+    VAR_FILE_ARGS+=(--var-file "$TMP_VAR_FILE")
 fi
-# Step 4: Upload terraform variables from input var-file.
+# Step 4: Collect terraform variables from input var-file.
 if [[ ! -v INPUT_VAR_FILE ]]; then
     debug_log "Detected no input for [var_file]"
 else
@@ -52,9 +53,13 @@ else
                 error_log "Path does not exist: \"$file\""
                 exit 1
             fi
-            terraform-upload-variable --workspace "$TF_WORKSPACE" --var-file "$file"
+            VAR_FILE_ARGS+=(--var-file "$file")
         done
 fi
+# Terraform variables are uploaded from all files in a single invocation; later files take precedence
+if [[ ${#VAR_FILE_ARGS[@]} -gt 0 ]]; then
+    terraform-upload-variable --workspace "$TF_WORKSPACE" "${VAR_FILE_ARGS[@]}"
+fi
 end_group
 
 # Step 5: Upload configuration version to workspace for run.
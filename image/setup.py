@@ -1,10 +1,18 @@
 #!/usr/bin/env python
-from setuptools import find_packages, setup
+from setuptools import setup
 
 setup(
     name="terraform-interations",
     version="1.0.0",
-    packages=find_packages("src"),
+    packages=[
+        "terraform_parse_cicd_config",
+        "terraform_configure_workspace",
+        "terraform_execution_summary",
+        "terraform_upload_variable",
+        "terraform_state_outputs",
+        "github_pull_request_comment",
+        "utilities",
+    ],
     package_dir={"": "src"},
     entry_points={
         "console_scripts": [
@@ -16,5 +24,5 @@ setup(
             "github-pull-request-comment=github_pull_request_comment.__main__:main",
         ]
     },
-    install_requires=["requests", "pyyaml", "cfgv", "terrasnek", "python-hcl2"],
+    install_requires=["requests", "pyyaml", "cfgv", "terrasnek", "python-hcl2", "orjson"],
 )
@@ -17,18 +17,25 @@ __author__ = "Noah Eldreth"
 __version__ = "1.0.0"
 
 import os
+import functools
 import sys
 import re
-import json
 import logging
 import argparse
 from typing import Optional, Any, Iterable
+import requests
+from urllib3.util.retry import Retry
 from github import Github
 from github import Auth
 from github.GithubException import GithubException
 from utilities.logging import debug, error
+from utilities.serialization import load_file, dumps_bytes
 from utilities.exception_handler import exception_handler
 
+# Patterns used to extract Pull Request number from refs/urls
+PULLS_URL_REGEX = re.compile(r"pulls/(\d+)")
+PULL_REF_REGEX = re.compile(r"refs/pull/(\d+)/")
+
 
 def parse_arguments():
     """
@@ -60,19 +67,45 @@ class WorkflowException(Exception):
     """An exception that should result in an error in the workflow log"""
 
 
-def paged_get(self, url, *args, **kwargs) -> Iterable[dict[str, Any]]:
+def paged_get(url: str, *, params: Optional[dict[str, Any]] = None) -> Iterable[dict[str, Any]]:
+    """
+    Iterate items of a paginated GitHub REST API list endpoint.
+    Pages are requested lazily over a shared keep-alive session; callers may stop
+    iterating early to skip trailing pages.
+    """
+    # Request maximum page size
+    params = {"per_page": GITHUB_PER_PAGE, **(params or {})}
     while True:
-        response = self.api_request("GET", url, *args, **kwargs)
+        response = SESSION.get(url, params=params, timeout=30)
         response.raise_for_status()
 
         yield from response.json()
 
         if "next" in response.links:
-            url = response.links["next"]["url"]
+            # Link header already carries query parameters
+            url, params = response.links["next"]["url"], None
         else:
             return
 
 
+@functools.lru_cache(maxsize=None)
+def get_github_client():
+    """
+    Create (once per process) a client for GitHub API.
+    Client retries transient failures and pools connections for reuse across requests.
+
+    Returns:
+        Github: GitHub client.
+    """
+    return Github(
+        auth=Auth.Token(GITHUB_TOKEN),
+        verify=True,
+        per_page=GITHUB_PER_PAGE,
+        retry=Retry(total=3, backoff_factor=0.3),
+        pool_size=10,
+    )
+
+
 def find_pull_request():
     """
     Identify appropriate Pull Request ID via configured session variables
@@ -82,14 +115,15 @@ def find_pull_request():
     """
     event: Optional[dict[str, Any]]
 
-    if os.path.isfile(os.environ["GITHUB_EVENT_PATH"]):
-        with open(os.environ["GITHUB_EVENT_PATH"]) as file:
-            event = json.load(file)
+    # Snapshot runner environment once
+    event_path = os.environ["GITHUB_EVENT_PATH"]
+    event_type = os.environ["GITHUB_EVENT_NAME"]
+
+    if os.path.isfile(event_path):
+        event = load_file(event_path)
     else:
         event = None
 
-    event_type = os.environ["GITHUB_EVENT_NAME"]
-
     if event_type in [
         "pull_request",
         "pull_request_review_comment",
@@ -120,13 +154,11 @@ def find_pull_request():
             # Event payload is not available
 
             if os.environ.get("GITHUB_REF_TYPE") == "branch":
-                if match := re.match(
-                    r"refs/pull/(\d+)/", os.environ.get("GITHUB_REF", "")
-                ):
+                if match := PULL_REF_REGEX.match(os.environ.get("GITHUB_REF", "")):
                     return match.group(1)
 
             raise WorkflowException(
-                f'Event payload is not available at the GITHUB_EVENT_PATH {os.environ["GITHUB_EVENT_PATH"]!r}. '
+                f'Event payload is not available at the GITHUB_EVENT_PATH {event_path!r}. '
                 + f"This is required when run by {event_type} events. The environment has not been setup properly by the actions runner. "
                 + "This can happen when the runner is running in a container"
             )
@@ -143,21 +175,19 @@ def find_pull_request():
                 "The pull_request object in the client_payload must have a url"
             )
 
-        match = re.match(r"pulls/(\d+)", event["client_payload"]["pull_request"]["url"])
+        match = PULLS_URL_REGEX.search(event["client_payload"]["pull_request"]["url"])
         return match.group(1)
 
     elif event_type == "push":
         repo = os.environ["GITHUB_REPOSITORY"]
         commit = os.environ["GITHUB_SHA"]
 
-        def pull_requsts() -> Iterable[dict[str, Any]]:
-            url = f'{os.environ["GITHUB_API_URL"]}/repos/{repo}/pulls'
-            yield from paged_get(url, params={"state": "all"})
-
-        for pull_requst in pull_requsts():
-            if pull_requst["merge_commit_sha"] == commit:
-                match = re.match(r"pulls/(\d+)", pull_requst["url"])
-                return match.group(1)
+        # Only pull requests associated with the pushed commit are returned
+        api_url = os.environ["GITHUB_API_URL"]
+        url = f"{api_url}/repos/{repo}/commits/{commit}/pulls"
+        for pull_request in paged_get(url):
+            if pull_request["merge_commit_sha"] == commit:
+                return pull_request["number"]
 
         raise WorkflowException(
             f"No PR found in {repo} for commit {commit} (was it pushed directly to the target branch?)"
@@ -166,50 +196,141 @@ def find_pull_request():
     raise WorkflowException(f"The {event_type} event doesn't relate to a Pull Request.")
 
 
+def get_issue_comments(repo: str, number: int) -> Iterable[dict[str, Any]]:
+    """
+    Iterate issue comments on Pull Request.
+    Listings shorter than one page are cached under RUNNER_TEMP alongside their
+    ETag and revalidated via conditional request; an unchanged listing costs a
+    single 304 response without body.
+    """
+    url = f'{os.environ["GITHUB_API_URL"]}/repos/{repo}/issues/{number}/comments'
+    cache_path, cache, headers = None, None, {}
+    if runner_temp := os.environ.get("RUNNER_TEMP"):
+        # Keyed by repository and number; owner names cannot contain "_"
+        cache_path = os.path.join(runner_temp, f"ghpr_comments_{repo.replace('/', '_')}_{number}.json")
+        try:
+            cache = load_file(cache_path)
+            # A full page may have more comments on following pages its ETag does not cover
+            if len(cache["comments"]) < GITHUB_PER_PAGE:
+                headers["If-None-Match"] = cache["etag"]
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing or unreadable cache is a miss; listing is requested unconditionally
+            cache, headers = None, {}
+
+    response = SESSION.get(
+        url, params={"per_page": GITHUB_PER_PAGE}, headers=headers, timeout=30
+    )
+    if response.status_code == 304:
+        debug("Issue comments unchanged since last request; using cached comments.")
+        yield from cache["comments"]
+        return
+    response.raise_for_status()
+    comments = response.json()
+
+    if "next" in response.links:
+        # ETag only covers first page; multi-page listings are not cached
+        yield from comments
+        yield from paged_get(response.links["next"]["url"])
+        return
+
+    # Only listings shorter than a page are complete; a full page is never cached
+    if cache_path and "ETag" in response.headers and len(comments) < GITHUB_PER_PAGE:
+        write_comments_cache(cache_path, response.headers["ETag"], comments)
+    yield from comments
+
+
+def write_comments_cache(path: str, etag: str, comments: list[dict[str, Any]]) -> None:
+    """
+    Write issue comment listing and its ETag to cache. Replaced atomically so readers never observe a partial file.
+    Failure to cache is not fatal; comments are simply requested again on next invocation.
+    """
+    partial_path = f"{path}.{os.getpid()}"
+    try:
+        with open(partial_path, "wb") as file:
+            file.write(dumps_bytes({"etag": etag, "comments": comments}))
+        os.replace(partial_path, path)
+    except (OSError, TypeError, ValueError) as exception:
+        debug(f"Unable to cache issue comments at [{path}]: {exception}")
+        try:
+            os.remove(partial_path)
+        except OSError:
+            pass
+
+
+def find_labeled_comment(repo: str, number: int, label: str) -> Optional[dict[str, Any]]:
+    """
+    Find first issue comment on Pull Request containing label.
+    Comments are requested lazily one page at a time; remaining pages are
+    never fetched once a match is found.
+    Returns:
+        dict: Matching comment or None.
+    """
+    for comment in get_issue_comments(repo, number):
+        if label in comment["body"]:
+            return comment
+    return None
+
+
 # ========= REQUIRED ENVIRONMENT VARIABLES =========
 # Auth to GitHub API
 GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
 
-# Token used to authenticate GitHub Client
-AUTH = Auth.Token(GITHUB_TOKEN)
-
 LOG_LEVEL = logging.INFO
-args = parse_arguments()
-github = Github(auth=AUTH, verify=True)
+
+# Maximum page size permitted by GitHub REST API; reduces round trips when scanning comments
+GITHUB_PER_PAGE = 100
+
+# Shared session for direct REST API requests; reuses TCP/TLS connection across pages
+SESSION = requests.Session()
+SESSION.headers.update(
+    {
+        "Authorization": f"Bearer {GITHUB_TOKEN}",
+        "Accept": "application/vnd.github+json",
+    }
+)
 
 
 @exception_handler
 def main():
+    args = parse_arguments()
+    github = get_github_client()
+
     debug(f"Searching for repository [{os.environ['GITHUB_REPOSITORY']}]...")
     repository = github.get_repo(os.environ["GITHUB_REPOSITORY"])
     debug("Searching for pull request...")
     pull_request = repository.get_pull(find_pull_request())
     with open(file=args.comment, mode="r", encoding="utf-8") as comment_file:
-        if args.label:
-            comments = pull_request.get_issue_comments()
+        body = comment_file.read()
+
+    if args.label:
+        debug(
+            f"Searching for applicable issue comment with matching label [{args.label}]..."
+        )
+        comment = find_labeled_comment(
+            repository.full_name, pull_request.number, args.label
+        )
+        if comment is not None:
+            if comment["body"] == body:
+                debug("Comment unchanged; skipping update.")
+                return
             debug(
-                f"Searching for applicable issue comment with matching label [{args.label}]..."
+                f"Updating issue comment on pull request [{str(pull_request.title)}]..."
             )
-            for comment in comments:
-                if args.label in comment.body:
-                    debug(
-                        f"Updating issue comment on pull request [{str(pull_request.title)}]..."
-                    )
-                    try:
-                        comment.edit(comment_file.read())
-                    except GithubException as exception:
-                        error(str(exception))
-                        sys.exit(1)
-                    debug("Comment updated.")
-                    return
-
-        debug(f"Writing issue comment on pull request [{str(pull_request.title)}]...")
-        try:
-            pull_request.create_issue_comment(comment_file.read())
-        except GithubException as exception:
-            error(str(exception))
-            sys.exit(1)
-        debug("Comment added.")
+            # Comment already held from listing; edited in place without re-fetching
+            response = SESSION.patch(comment["url"], json={"body": body}, timeout=30)
+            if not response.ok:
+                error(f"{response.status_code} {response.text}")
+                sys.exit(1)
+            debug("Comment updated.")
+            return
+
+    debug(f"Writing issue comment on pull request [{str(pull_request.title)}]...")
+    try:
+        pull_request.create_issue_comment(body)
+    except GithubException as exception:
+        error(str(exception))
+        sys.exit(1)
+    debug("Comment added.")
 
 
 if __name__ == "__main__":
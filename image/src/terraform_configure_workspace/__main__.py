@@ -33,11 +33,15 @@ import json
 import argparse
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
+import requests
 from terrasnek.api import TFC
 from terrasnek.exceptions import TFCException, TFCHTTPNotFound
 from utilities.logging import info, error
 from utilities.exception_handler import exception_handler
 from utilities.github_actions import set_output
+from utilities.serialization import dumps, dumps_bytes
+from utilities.environment import strtobool
 
 
 # ======================================= FUNCTIONS ========================================
@@ -116,7 +120,7 @@ def parse_arguments():
     return args
 
 
-def get_tfc_client():
+def get_tfc_client(hostname, organization, verify):
     """
     Create a client for target Terraform host/organization.
     
@@ -126,17 +130,36 @@ def get_tfc_client():
     try:
         terraform = TFC(
             TF_API_TOKEN,
-            url=f"https://{TF_CLOUD_HOSTNAME}",
-            verify=TF_VERIFY,
+            url=f"https://{hostname}",
+            verify=verify,
             log_level=LOG_LEVEL,
         )
-        terraform.set_org(TF_CLOUD_ORGANIZATION)
+        terraform.set_org(organization)
     except json.JSONDecodeError:
         error("Outgoing GET Request to [//.well-known/terraform.json].")
         sys.exit(1)
     return terraform
 
 
+def get_projects(terraform, organization, name):
+    """
+    Find project(s) matching name via single filtered request, rather than paging
+    through all organization projects.
+
+    Returns:
+        list: Matching Terraform Enterprise/Cloud project(s).
+    """
+    response = requests.get(
+        f"https://{terraform.get_hostname()}/api/v2/organizations/{organization}/projects",
+        params={"filter[names]": name, "page[size]": 1},
+        headers=terraform._headers,
+        verify=terraform._verify,
+        timeout=30,
+    )
+    response.raise_for_status()
+    return response.json()["data"]
+
+
 # ============================= REQUIRED ENVIRONMENT VARIABLES =============================
 # URL directing back to Octopus Project/GitHub Repository/etc
 # Friendly name for 'SOURCE_URL'
@@ -160,74 +183,76 @@ TF_PROJECT = os.environ.get("TF_PROJECT", None)
 TF_WORKSPACE = os.environ.get("TF_WORKSPACE", None)
 
 # Verify SSL when creating client for Terraform Enterprise/Cloud
-TF_VERIFY = eval(str(os.environ.get("TF_VERIFY", True)).capitalize())
+TF_VERIFY = strtobool(os.environ.get("TF_VERIFY", "true"))
 
 LOG_LEVEL = logging.INFO
 
-# Parse command-line arguments. Overwrite environment variables if provided.
-args = parse_arguments()
-
-if args.source_url and args.source_name:
-    SOURCE_URL = args.source_url
-    SOURCE_NAME = args.source_name
-if args.hostname:
-    TF_CLOUD_HOSTNAME = args.hostname
-if args.organization:
-    TF_CLOUD_ORGANIZATION = args.organization
-if args.project:
-    TF_PROJECT = args.project
-if args.workspace:
-    TF_WORKSPACE = args.workspace
-if args.tf_verify:
-    TF_VERIFY = args.tf_verify
-
-TF_WORKING_DIRECTORY = args.working_directory
-TF_EXECUTION_MODE = args.execution_mode
-TF_VERSION = args.terraform_version
-
-terraform = get_tfc_client()
-
-if TF_EXECUTION_MODE == "agent":
-    agent_pools = terraform.agents.list_pools()["data"]
-    if not agent_pools:
-        error("Could not find available Terraform Agent Pools.")
-        sys.exit(1)
-
-projects = terraform.projects.list_all(
-    filters=[{"keys": ["names"], "value": TF_PROJECT}]
-)["data"]
-if not projects:
-    error(f"Could not find Terraform Project [{TF_PROJECT}]")
-    sys.exit(1)
-
-payload = {
-    "data": {
-        "type": "workspaces",
-        "attributes": {
-            "name": TF_WORKSPACE,
-            "speculative-enabled": True,
-            "execution-mode": TF_EXECUTION_MODE,
-            "agent-pool-id": agent_pools[0]["id"]
-            if TF_EXECUTION_MODE == "agent"
-            else None,
-            "terraform-version": TF_VERSION,
-            "working-directory": TF_WORKING_DIRECTORY if TF_WORKING_DIRECTORY else "",
-            "auto-apply": False,
-            "source-url": SOURCE_URL,
-            "source-name": SOURCE_NAME,
-        },
-        "relationships": {"project": {"data": {"id": projects[0]["id"]}}},
-    }
-}
 
 @exception_handler
 def main():
     """
     Configure Terraform Enterprise/Cloud Workspace.
     """
+    # Parse command-line arguments. Overwrite environment variables if provided.
+    args = parse_arguments()
+
+    source_url, source_name = SOURCE_URL, SOURCE_NAME
+    if args.source_url and args.source_name:
+        source_url, source_name = args.source_url, args.source_name
+    hostname = args.hostname or TF_CLOUD_HOSTNAME
+    organization = args.organization or TF_CLOUD_ORGANIZATION
+    project = args.project or TF_PROJECT
+    workspace_name = args.workspace or TF_WORKSPACE
+    verify = args.tf_verify or TF_VERIFY
+
+    terraform = get_tfc_client(hostname, organization, verify)
+
+    # Agent pool and project lookups are independent; request both concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        agent_pools_future = executor.submit(
+            lambda: terraform.agents.list_pools()["data"]
+            if args.execution_mode == "agent"
+            else []
+        )
+        projects_future = executor.submit(
+            get_projects, terraform, organization, project
+        )
+        agent_pools, projects = agent_pools_future.result(), projects_future.result()
+
+    if args.execution_mode == "agent" and not agent_pools:
+        error("Could not find available Terraform Agent Pools.")
+        sys.exit(1)
+    if not projects:
+        error(f"Could not find Terraform Project [{project}]")
+        sys.exit(1)
+
+    attributes = {
+        "name": workspace_name,
+        "speculative-enabled": True,
+        "execution-mode": args.execution_mode,
+        "agent-pool-id": agent_pools[0]["id"]
+        if args.execution_mode == "agent"
+        else None,
+        "terraform-version": args.terraform_version,
+        "working-directory": args.working_directory if args.working_directory else "",
+        "auto-apply": False,
+        "source-url": source_url,
+        "source-name": source_name,
+    }
+    # Omit unset attributes rather than sending explicit nulls
+    payload = {
+        "data": {
+            "type": "workspaces",
+            "attributes": {
+                key: value for key, value in attributes.items() if value is not None
+            },
+            "relationships": {"project": {"data": {"id": projects[0]["id"]}}},
+        }
+    }
+
     try:
-        info(f"Configuring Workspace [{TF_WORKSPACE}]")
-        workspace = terraform.workspaces.show(TF_WORKSPACE)
+        info(f"Configuring Workspace [{workspace_name}]")
+        workspace = terraform.workspaces.show(workspace_name)
         workspace = terraform.workspaces.update(
             workspace_id=workspace["data"]["id"], payload=payload
         )
@@ -243,8 +268,10 @@ def main():
     set_output(
         "project_id", str(workspace["data"]["relationships"]["project"]["data"]["id"])
     )
-    info(f"Configured Workspace with setting\n{json.dumps(payload, indent=2)}")
-    sys.stdout.write(json.dumps(workspace, indent=4))
+    info(
+        f"Configured Workspace with setting\n{dumps(payload, indent=LOG_LEVEL <= logging.DEBUG)}"
+    )
+    sys.stdout.buffer.write(dumps_bytes(workspace, indent=True))
 
 
 if __name__ == "__main__":
@@ -26,17 +26,21 @@ __version__ = "1.0.0"
 import os
 import sys
 import re
-import string
-import random
 import json
+import shutil
+import tempfile
 import argparse
 import logging
 from json import JSONDecodeError
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 from terrasnek.api import TFC
 from terrasnek.exceptions import TFCException
 from utilities.logging import info, debug, error
 from utilities.github_actions import set_output
+from utilities.serialization import loads, dumps
+from utilities.environment import strtobool
 from utilities.exception_handler import exception_handler
 
 
@@ -93,15 +97,153 @@ def get_tfc_client():
     return terraform
 
 
-def get_random_string():
-    return "".join(random.choice(string.ascii_lowercase) for i in range(8))
+def create_temporary_file(prefix, mode="w+b", encoding=None):
+    """
+    Create a uniquely named file under target temporary directory; file is retained after closing.
+
+    Args:
+        prefix (str): File name prefix.
+        mode (str): File mode.
+        encoding (str): File encoding; text modes only.
+
+    Returns:
+        NamedTemporaryFile: Open file.
+    """
+    return tempfile.NamedTemporaryFile(
+        mode=mode, encoding=encoding, dir=args.path, prefix=prefix, suffix=".txt", delete=False
+    )
+
+
+def stream_execution_log(log, tmp, split_lines):
+    """
+    Write a streamed execution log to disk chunk by chunk.
+
+    Args:
+        log (Response): Streamed response for execution log.
+        tmp (BufferedWriter): Target file.
+        split_lines (bool): Yield each complete line of the log as it is written.
+
+    Returns:
+        Generator: Lines (bytes) of execution log; empty if split_lines is False.
+    """
+    pending = b""
+    for chunk in log.iter_content(chunk_size=65536):
+        tmp.write(chunk)
+        if split_lines:
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            yield from lines
+    if pending:
+        yield pending
+
+
+def download_execution_log(url, tmp, applicable_action=None):
+    """
+    Stream a Plan/Apply execution log to disk rather than buffering the entire body in memory.
+    If an applicable action is provided hook actions are counted in the same pass.
+
+    Args:
+        url (str): Archivist url of the execution log.
+        tmp (BufferedRandom): Target file; closed once written.
+        applicable_action (str): Log message type of which to count hook actions: planned_change or apply_complete.
+
+    Returns:
+        tuple: Path of the written execution log; counts of imports, additions, changes and destructions (None if not requested).
+    """
+    counters = dict.fromkeys(["import", "create", "update", "delete"], 0)
+    # Cheap substring checks skip parsing lines that cannot be applicable hooks
+    applicable_action_marker = f'"{applicable_action}"'.encode("utf-8")
+    with tmp:
+        log = SESSION.get(url=url, stream=True)
+        log.raise_for_status()
+        for line in stream_execution_log(log, tmp, applicable_action is not None):
+            if applicable_action_marker not in line or b'"hook"' not in line:
+                continue
+            try:
+                execution_data = loads(line)
+            except JSONDecodeError:
+                continue
+            if "type" not in execution_data:
+                continue
+            if execution_data['type'] != applicable_action:
+                continue
+            if "hook" not in execution_data:
+                continue
+            if "action" not in execution_data['hook']:
+                continue
+
+            if execution_data['hook']['action'] in counters:
+                counters[execution_data['hook']['action']] += 1
+
+    if applicable_action is None:
+        return tmp.name, None
+    return tmp.name, (counters["import"], counters["create"], counters["update"], counters["delete"])
+
+
+def download_plan_json(plan_id, tmp):
+    """
+    Download JSON output for a Terraform Plan.
+
+    Args:
+        plan_id (str): Terraform plan-id.
+        tmp (BufferedRandom): Target file; closed once read.
+
+    Returns:
+        dict: Decoded JSON output; None if unavailable.
+    """
+    with tmp:
+        try:
+            terraform.plans.download_json(plan_id=plan_id, target_path=tmp.name)
+            return loads(tmp.read())
+        except TypeError:
+            return None
+
+
+def get_task_result(task_result_id):
+    """
+    Get details of a Terraform run-task result.
 
+    Args:
+        task_result_id (str): Terraform task-result-id.
 
-def render_string(data):
-    if len(data) > 1000:
-        return "(Hidden Large Value)"
+    Returns:
+        dict: Task result response.
+    """
+    response = SESSION.get(
+        f"{TF_URL}/api/v2/task-results/{task_result_id}",
+        headers=terraform._headers,
+        verify=terraform._verify,
+    )
+    response.raise_for_status()
+    return response.json()
 
-    return f'"{data}"'
+
+def download_policy_check(policy_check_id, path):
+    """
+    Stream output of a Terraform policy check to disk.
+
+    Args:
+        policy_check_id (str): Terraform policy-check-id.
+        path (str): Target file path.
+
+    Returns:
+        str: Path of the written policy check output; None if policy check has no output.
+    """
+    policy_check_results = terraform.policy_checks.show(policy_check_id)["data"]
+    if "output" not in policy_check_results.get("links", {}):
+        return None
+    info(f"Downloading Terraform Run policy check results...")
+    with SESSION.get(
+        f"{TF_URL}{policy_check_results['links']['output']}",
+        headers=terraform._headers,
+        verify=terraform._verify,
+        stream=True,
+    ) as response:
+        response.raise_for_status()
+        with open(file=path, mode="wb") as tmp:
+            for chunk in response.iter_content(chunk_size=65536):
+                tmp.write(chunk)
+    return path
 
 
 def render_bool(data):
@@ -112,58 +254,129 @@ def render_none():
     return "null"
 
 
-def render_dict(data, start_with_indention, indention_level=1):
-    tabs = "   " * indention_level
+class IndentionCache(dict):
+    """
+    Indention strings keyed by indention level; built once per level on first use.
+    """
+
+    def __missing__(self, indention_level):
+        tabs = self[indention_level] = "   " * indention_level
+        return tabs
+
+
+def render_value(parts, value, indention_level=1):
+    """
+    Append rendered value to list of output fragments.
+    """
+    renderer = RENDERERS.get(type(value))
+    if renderer is None:
+        parts.append(f"{value}")
+    else:
+        renderer(parts, value, indention_level)
+
+
+def render_dict(parts, data, start_with_indention, indention_level=1):
+    tabs = INDENTION[indention_level]
     if not data:
-        return (tabs if start_with_indention else "") + "{}"
+        parts.append((tabs if start_with_indention else "") + "{}")
+        return
     
-    result = (tabs if start_with_indention else "") + "{\n"
+    parts.append((tabs if start_with_indention else "") + "{\n")
+    values_tab = INDENTION[indention_level + 1]
     for key, value in data.items():
-        values_tab = "   " * (indention_level + 1)
         key_rendered = key
         if SPECIAL_CHARACTERS_REGEX.search(str(key)) is not None:
             key_rendered = f'"{key}"'
-        if type(value) is dict:
-            result += f"{values_tab}{key_rendered} = {render_dict(value, start_with_indention=False, indention_level=indention_level + 1)}\n"
-        elif type(value) is list:
-            result += f"{values_tab}{key_rendered} = {render_list(value, start_with_indention=False, indention_level=indention_level + 1)}\n"
-        elif type(value) is str:
-            result += f"{values_tab}{key_rendered} = {render_string(value)}\n"
-        elif type(value) is bool:
-            result += f"{values_tab}{key_rendered} = {render_bool(value)}\n"
-        elif type(value) == type(None):
-            result += f"{values_tab}{key_rendered} = {render_none()}\n"
-        else:
-            result += f"{values_tab}{key_rendered} = {value}\n"
-    result += tabs + "}"
-    return result
+        parts.append(f"{values_tab}{key_rendered} = ")
+        render_value(parts, value, indention_level=indention_level + 1)
+        parts.append("\n")
+    parts.append(tabs + "}")
 
 
-def render_list(data, start_with_indention, indention_level=1):
-    tabs = "   " * indention_level
+def render_list(parts, data, start_with_indention, indention_level=1):
+    tabs = INDENTION[indention_level]
     if not data:
-        return (tabs if start_with_indention else "") + "[]"
+        parts.append((tabs if start_with_indention else "") + "[]")
+        return
     
-    result = (tabs if start_with_indention else "") + "[\n"
+    parts.append((tabs if start_with_indention else "") + "[\n")
+    values_tab = INDENTION[indention_level + 1]
     for value in data:
-        values_tab = "   " * (indention_level + 1)
-        if type(value) is dict:
-            result += f"{values_tab}{render_dict(value, start_with_indention=False, indention_level=indention_level + 1)}\n"
-        elif type(value) is list:
-            result += f"{values_tab}{render_list(value, start_with_indention=False, indention_level=indention_level + 1)}\n"
-        elif type(value) is str:
-            result += f"{values_tab}{render_string(value)}\n"
-        elif type(value) is bool:
-            result += f"{values_tab}{render_bool(value)}\n"
-        elif type(value) == type(None):
-            result += f"{values_tab}{render_none()}\n"
-        else:
-            result += f"{values_tab}{value}\n"
-    result += tabs + "]"
-    return result
+        parts.append(values_tab)
+        render_value(parts, value, indention_level=indention_level + 1)
+        parts.append("\n")
+    parts.append(tabs + "]")
+
+
+def get_attributes(before, after):
+    """
+    Sorted union of keys (dict) or indexes (list) across before and after objects.
+    """
+    before_type, after_type = type(before), type(after)
+    if before_type is list and after_type is list:
+        # Indexes of longer list are already sorted and cover both lists
+        return range(max(len(before), len(after)))
+
+    if before_type is dict:
+        before_keys = before.keys()
+    elif before_type is list:
+        before_keys = range(len(before))
+    else:
+        before_keys = ()
+
+    if after_type is dict:
+        after_keys = after.keys()
+    elif after_type is list:
+        after_keys = range(len(after))
+    else:
+        after_keys = ()
+
+    if before_type is dict and after_type is dict:
+        return sorted(before_keys | after_keys)
+    if not after_keys:
+        return sorted(before_keys)
+    if not before_keys:
+        return sorted(after_keys)
+    return sorted(set([*before_keys, *after_keys]))
+
+
+class SensitiveData:
+    """
+    Placeholder for masked values; rendered verbatim rather than as a quoted string.
+    """
+
+    def __str__(self):
+        return "(Sensitive Data)"
+
+
+def is_sensitive(attribute, sensitive):
+    """
+    Whether attribute is flagged sensitive by name or by sensitivity map.
+    """
+    if SENSITIVE_KEYS_REGEX.search(str(attribute)) is not None:
+        return True
+    return attribute in sensitive and (sensitive[attribute] is True or sensitive[attribute] == [True])
+
+
+def mask_sensitive(value, sensitive):
+    """
+    Copy of object with sensitive attributes (at any depth) replaced by placeholder.
+    """
+    if type(value) is dict:
+        return {
+            key: SENSITIVE_DATA if is_sensitive(key, sensitive) else mask_sensitive(item, sensitive)
+            for key, item in value.items()
+        }
+    if type(value) is list:
+        return [
+            SENSITIVE_DATA if is_sensitive(index, sensitive) else mask_sensitive(item, sensitive)
+            for index, item in enumerate(value)
+        ]
+    return value
 
 
 def compare_values(
+    parts,
     before,
     after,
     before_sensitive,
@@ -172,83 +385,63 @@ def compare_values(
     replace_paths=None,
     indention_level=1,
 ):
-    result = ""
-    # Parse Union of Fields Between Before Object and After Object
-    if type(before) is dict:
-        before_keys = before.keys()
-    elif type(before) is list:
-        before_keys = [*range(0, len(before), 1)]
-    else:
-        before_keys = []
-
-    if type(after) is dict:
-        after_keys = after.keys()
-    elif type(after) is list:
-        after_keys = [*range(0, len(after), 1)]
-    else:
-        after_keys = []
-
-    attributes = sorted(list(set([*before_keys, *after_keys])))
-    # End of Region
-
-    # Find Corresponding Value Per Attribute if it Exists
-    for attribute in attributes:
-        try:
-            before_value = before[attribute]
-        except (TypeError, KeyError, IndexError):
-            before_value = None
-
-        try:
-            after_value = after[attribute]
-        except (TypeError, KeyError, IndexError):
-            try:
-                after_value = after_unknown[attribute]
-            except (TypeError, KeyError, IndexError):
-                after_value = None
-        # End of Region
-
-        # If Before and After Values are the Same
-        tabs = "   " * indention_level
-        if before_value == after_value:
-            if type(before_value) is str:
-                before_value_rendered = render_string(before_value)
-            elif type(before_value) is bool:
-                before_value_rendered = render_bool(before_value)
-            elif type(before_value) == type(None):
-                before_value_rendered = render_none()
-            elif type(before_value) is dict:
-                before_value_rendered = render_dict(
-                    before_value,
-                    start_with_indention=False,
-                    indention_level=indention_level + 1,
-                )
-            elif type(before_value) is list:
-                before_value_rendered = render_list(
-                    before_value,
-                    start_with_indention=False,
-                    indention_level=indention_level + 1,
-                )
+    # Nested objects are walked via explicit stack rather than recursion.
+    # Frames hold remaining attributes of an object; closing brackets are stacked as strings.
+    stack = [
+        (iter(get_attributes(before, after)), before, after, replace_paths, indention_level)
+    ]
+    while stack:
+        frame = stack[-1]
+        if type(frame) is str:
+            parts.append(stack.pop())
+            continue
+
+        attributes, before, after, replace_paths, indention_level = frame
+        tabs = INDENTION[indention_level]
+        before_type, after_type = type(before), type(after)
+        before_length = len(before) if before_type is list else 0
+        after_length = len(after) if after_type is list else 0
+
+        # Find Corresponding Value Per Attribute if it Exists
+        for attribute in attributes:
+            if before_type is dict:
+                before_value = before.get(attribute)
+            elif type(attribute) is int and attribute < before_length:
+                before_value = before[attribute]
             else:
-                before_value_rendered = before_value
-            if SPECIAL_CHARACTERS_REGEX.search(str(attribute)) is not None:
-                attributed_rendered = f'"{attribute}"'
+                before_value = None
+
+            if after_type is dict and attribute in after:
+                after_value = after[attribute]
+            elif type(attribute) is int and attribute < after_length:
+                after_value = after[attribute]
+            elif type(after_unknown) is dict:
+                after_value = after_unknown.get(attribute)
             else:
-                attributed_rendered = attribute
-            # Redundant print for non-factor updates i.e. no changes
-            # result += (f"{tabs}{attributed_rendered} = {str(before_value_rendered)} (No Change)\n")
+                after_value = None
+            # End of Region
+
+            # If Before and After Values are the Same
+            # Redundant print for non-factor updates i.e. no changes is omitted
+            if before_value == after_value:
+                continue
+            # End of Region
+
+            attribute_string = str(attribute)
 
-        # End of Region
-        else:
             # Execute Checks Against Values: Nested JSON? Sensitive Attributes? Known After Apply?
-            try:
-                before_value = json.loads(before_value)
-            except (TypeError, JSONDecodeError):
-                pass
+            # Only strings that could begin a JSON document are parsed
+            if type(before_value) is str and before_value[:1] in JSON_LEADING_CHARACTERS:
+                try:
+                    before_value = loads(before_value)
+                except JSONDecodeError:
+                    pass
 
-            try:
-                after_value = json.loads(after_value)
-            except (TypeError, JSONDecodeError):
-                pass
+            if type(after_value) is str and after_value[:1] in JSON_LEADING_CHARACTERS:
+                try:
+                    after_value = loads(after_value)
+                except JSONDecodeError:
+                    pass
 
             before_sensitive_bool = False
             if attribute in before_sensitive:
@@ -264,7 +457,7 @@ def compare_values(
                 ]:
                     after_sensitive_bool = True
 
-            if any(check in str(attribute).lower() for check in SENSITIVE_KEYS):
+            if SENSITIVE_KEYS_REGEX.search(attribute_string) is not None:
                 before_sensitive_bool = True
                 after_sensitive_bool = True
 
@@ -285,143 +478,117 @@ def compare_values(
             # Parse Nested JSON Objects
             if (
                 type(before_value) is dict
-                and (before_value and after_value is not None)
+                and before_value
+                and type(after_value) in CONTAINER_TYPES
                 and not before_sensitive_bool
                 and not after_sensitive_bool
                 and not after_unknown_bool
             ):
                 if type(attribute) is str:
-                    result += (f"{tabs}{attribute}" + " = {") + (
+                    parts.append((f"{tabs}{attribute}" + " = {") + (
                         " -> (Forces Replacement)\n" if forces_replacement else "\n"
-                    )
+                    ))
                 else:
-                    result += (f"{tabs}" + "{") + (
+                    parts.append((f"{tabs}" + "{") + (
                         " -> (Forces Replacement)\n" if forces_replacement else "\n"
+                    ))
+                stack.append(tabs + "}\n")
+                stack.append(
+                    (
+                        iter(get_attributes(before_value, after_value)),
+                        before_value,
+                        after_value,
+                        None,
+                        indention_level + 1,
                     )
-                result += compare_values(
-                    before_value,
-                    after_value,
-                    before_sensitive,
-                    after_sensitive,
-                    after_unknown,
-                    indention_level=indention_level + 1,
                 )
-                result += tabs + "}\n"
+                break
             # End of Region
 
             # Parse Nested Lists
             elif (
                 type(before_value) is list
-                and (before_value and after_value is not None)
+                and before_value
+                and type(after_value) in CONTAINER_TYPES
                 and not before_sensitive_bool
                 and not after_sensitive_bool
                 and not after_unknown_bool
             ):
-                result += (f"{tabs}{attribute}" + " = [") + (
+                parts.append((f"{tabs}{attribute}" + " = [") + (
                     " -> (Forces Replacement)\n" if forces_replacement else "\n"
-                )
-                result += compare_values(
-                    before_value,
-                    after_value,
-                    before_sensitive,
-                    after_sensitive,
-                    after_unknown,
-                    indention_level=indention_level + 1,
-                )
-                result += tabs + "]\n"
-            # End of Region
-
-            # Append New Lines to Result String
-            else:
-                if before_sensitive_bool:
-                    before_value_rendered = "(Sensitive Data)"
-                elif type(before_value) is str:
-                    before_value_rendered = render_string(before_value)
-                elif type(before_value) is bool:
-                    before_value_rendered = render_bool(before_value)
-                elif type(before_value) == type(None):
-                    before_value_rendered = render_none()
-                elif type(before_value) is dict:
-                    before_value_rendered = render_dict(
-                        before_value,
-                        start_with_indention=False,
-                        indention_level=indention_level + 1,
-                    )
-                elif type(before_value) is list:
-                    before_value_rendered = render_list(
+                ))
+                stack.append(tabs + "]\n")
+                stack.append(
+                    (
+                        iter(get_attributes(before_value, after_value)),
                         before_value,
-                        start_with_indention=False,
-                        indention_level=indention_level + 1,
-                    )
-                else:
-                    before_value_rendered = before_value
-
-                if after_sensitive_bool:
-                    after_value_rendered = "(Sensitive Data)"
-                elif after_unknown_bool:
-                    after_value_rendered = "(Known After Apply)"
-                elif type(after_value) is str:
-                    after_value_rendered = render_string(after_value)
-                elif type(after_value) is bool:
-                    after_value_rendered = render_bool(after_value)
-                elif type(after_value) == type(None):
-                    after_value_rendered = render_none()
-                elif type(after_value) is dict:
-                    after_value_rendered = render_dict(
                         after_value,
-                        start_with_indention=False,
-                        indention_level=indention_level + 1,
+                        None,
+                        indention_level + 1,
                     )
-                elif type(after_value) is list:
-                    after_value_rendered = render_list(
-                        after_value,
-                        start_with_indention=False,
-                        indention_level=indention_level + 1,
-                    )
-                else:
-                    after_value_rendered = after_value
+                )
+                break
+            # End of Region
 
-                if SPECIAL_CHARACTERS_REGEX.search(str(attribute)) is not None:
+            # Append New Lines to Output Fragments
+            else:
+                if SPECIAL_CHARACTERS_REGEX.search(attribute_string) is not None:
                     attributed_rendered = f'"{attribute}"'
                 else:
                     attributed_rendered = attribute
 
-                if before_value == None and after_value != None:
-                    symbol = PARSING_LIBRARY["add"]["symbol"]
-                elif before_value != None and after_value == None:
-                    symbol = PARSING_LIBRARY["delete"]["symbol"]
+                # Object replaced by scalar (or vice versa) is a single update; nested sensitive attributes stay masked
+                type_changed = (
+                    before_value is not None
+                    and after_value is not None
+                    and (type(before_value) in CONTAINER_TYPES) != (type(after_value) in CONTAINER_TYPES)
+                )
+                if type_changed:
+                    before_value = mask_sensitive(before_value, before_sensitive)
+                    after_value = mask_sensitive(after_value, after_sensitive)
+
+                if before_value is None and after_value is not None:
+                    symbol = ADD_SYMBOL
+                elif before_value is not None and after_value is None:
+                    symbol = DELETE_SYMBOL
                 else:
-                    symbol = PARSING_LIBRARY["update"]["symbol"]
+                    symbol = UPDATE_SYMBOL
 
                 if (
                     before_value is None
                     and after_value is not None
                     and type(attribute) is int
                 ):
-                    result += (f"{tabs}{symbol} {str(after_value_rendered)}") + (
-                        " -> (Forces Replacement)\n" if forces_replacement else "\n"
-                    )
+                    parts.append(f"{tabs}{symbol} ")
                 elif (
                     before_value is None
                     and after_value is not None
                     and not type(attribute) is int
                 ):
-                    result += (
-                        f"{tabs}{symbol} {attributed_rendered} = {str(after_value_rendered)}"
-                        + (" -> (Forces Replacement)\n" if forces_replacement else "\n")
-                    )
+                    parts.append(f"{tabs}{symbol} {attributed_rendered} = ")
                 else:
-                    result += (
-                        f"{tabs}{symbol} {attributed_rendered} = {str(before_value_rendered)} -> {str(after_value_rendered)}"
-                        + (" -> (Forces Replacement)\n" if forces_replacement else "\n")
-                    )
-            # End of Region
+                    parts.append(f"{tabs}{symbol} {attributed_rendered} = ")
+                    if before_sensitive_bool:
+                        parts.append("(Sensitive Data)")
+                    else:
+                        render_value(parts, before_value, indention_level=indention_level + 1)
+                    parts.append(" -> ")
 
-    return result
+                if after_sensitive_bool:
+                    parts.append("(Sensitive Data)")
+                elif after_unknown_bool:
+                    parts.append("(Known After Apply)")
+                else:
+                    render_value(parts, after_value, indention_level=indention_level + 1)
+                parts.append(" -> (Forces Replacement)\n" if forces_replacement else "\n")
+            # End of Region
+        else:
+            # All attributes of object evaluated
+            stack.pop()
 
 
 def parse_changes(resources):
-    result = """
+    header = """
 Resource actions are indicated with the following symbols:
     + create resource
     - destroy resource
@@ -430,166 +597,69 @@ Resource actions are indicated with the following symbols:
 
 Terraform will perform the following actions:
 """
+    # Output is gathered as list of fragments and joined once
+    parts = [header]
     if "resource_changes" in resources:
         for resource_change in resources["resource_changes"]:
-            if not "no-op" in resource_change["change"]["actions"]:
-                before_sensitive = {}
-                if "before_sensitive" in resource_change["change"]:
-                    if type(resource_change["change"]["before_sensitive"]) is dict:
-                        before_sensitive = resource_change["change"]["before_sensitive"]
-
-                after_sensitive = {}
-                if "after_sensitive" in resource_change["change"]:
-                    if type(resource_change["change"]["after_sensitive"]) is dict:
-                        after_sensitive = resource_change["change"]["after_sensitive"]
-
-                after_unknown = {}
-                if "after_unknown" in resource_change["change"]:
-                    if type(resource_change["change"]["after_unknown"]) is dict:
-                        after_unknown = resource_change["change"]["after_unknown"]
-
-                replace_paths = []
-                if "replace_paths" in resource_change["change"]:
-                    if type(resource_change["change"]["replace_paths"]) is list:
-                        if resource_change["change"]["replace_paths"]:
-                            replace_paths = resource_change["change"]["replace_paths"][0]
-
-                # Action: CREATE/DESTROY
-                if (
-                    "create" in resource_change["change"]["actions"]
-                    and "delete" in resource_change["change"]["actions"]
-                ):
-                    result += (
-                        RESOURCE_MESSAGE.format(
-                            resource_change["provider_name"],
-                            resource_change["type"],
-                            resource_change["address"],
-                            "This resource must be replaced.",
-                            "/".join(
-                                [
-                                    PARSING_LIBRARY["add"]["symbol"],
-                                    PARSING_LIBRARY["delete"]["symbol"],
-                                ]
-                            ),
-                            " ".join(
-                                [
-                                    "resource",
-                                    f'"{resource_change["type"]}"',
-                                    f'"{resource_change["name"]}"',
-                                ]
-                            ),
-                        )
-                        + "{\n"
-                    )
-                    result += compare_values(
-                        resource_change["change"]["before"],
-                        resource_change["change"]["after"],
-                        before_sensitive,
-                        after_sensitive,
-                        after_unknown,
-                        replace_paths,
-                    )
-                    result += "}\n"
-
-                # Action: CREATE
-                elif (
-                    "create" in resource_change["change"]["actions"]
-                    and "delete" not in resource_change["change"]["actions"]
-                ):
-                    result += (
-                        RESOURCE_MESSAGE.format(
-                            resource_change["provider_name"],
-                            resource_change["type"],
-                            resource_change["address"],
-                            PARSING_LIBRARY["add"]["message"],
-                            PARSING_LIBRARY["add"]["symbol"],
-                            " ".join(
-                                [
-                                    "resource",
-                                    f'"{resource_change["type"]}"',
-                                    f'"{resource_change["name"]}"',
-                                ]
-                            ),
-                        )
-                        + "{\n"
-                    )
-                    result += compare_values(
-                        resource_change["change"]["before"],
-                        resource_change["change"]["after"],
-                        before_sensitive,
-                        after_sensitive,
-                        after_unknown,
-                    )
-                    result += "}\n"
-
-                # Action: DESTROY
-                elif (
-                    "delete" in resource_change["change"]["actions"]
-                    and "create" not in resource_change["change"]["actions"]
-                ):
-                    result += (
-                        RESOURCE_MESSAGE.format(
-                            resource_change["provider_name"],
-                            resource_change["type"],
-                            resource_change["address"],
-                            PARSING_LIBRARY["delete"]["message"],
-                            PARSING_LIBRARY["delete"]["symbol"],
-                            " ".join(
-                                [
-                                    "resource",
-                                    f'"{resource_change["type"]}"',
-                                    f'"{resource_change["name"]}"',
-                                ]
-                            ),
-                        )
-                        + "{\n"
-                    )
-                    result += compare_values(
-                        resource_change["change"]["before"],
-                        resource_change["change"]["after"],
-                        before_sensitive,
-                        after_sensitive,
-                        after_unknown,
-                    )
-                    result += "}\n"
-
-                # Action: UPDATE
-                elif "update" in resource_change["change"]["actions"]:
-                    result += (
-                        RESOURCE_MESSAGE.format(
-                            resource_change["provider_name"],
-                            resource_change["type"],
-                            resource_change["address"],
-                            PARSING_LIBRARY["update"]["message"],
-                            PARSING_LIBRARY["update"]["symbol"],
-                            " ".join(
-                                [
-                                    "resource",
-                                    f'"{resource_change["type"]}"',
-                                    f'"{resource_change["name"]}"',
-                                ]
-                            ),
-                        )
-                        + "{\n"
-                    )
-                    result += compare_values(
-                        resource_change["change"]["before"],
-                        resource_change["change"]["after"],
-                        before_sensitive,
-                        after_sensitive,
-                        after_unknown,
-                    )
-                    result += "}\n"
-                elif "read" in resource_change["change"]["actions"]:
+            actions = frozenset(resource_change["change"]["actions"])
+            if "no-op" in actions:
+                continue
+            if actions not in RESOURCE_ACTIONS:
+                if "read" in actions:
                     debug(f"Data resource found [{resource_change['address']}]")
-                else:
-                    error(
-                        f"Failed to parse plan action on resource [{resource_change['address']}]"
-                    )
-                    sys.exit(1)
-    result += "\n"
+                    continue
+                error(
+                    f"Failed to parse plan action on resource [{resource_change['address']}]"
+                )
+                sys.exit(1)
+            message, symbol = RESOURCE_ACTIONS[actions]
+
+            before_sensitive = {}
+            if "before_sensitive" in resource_change["change"]:
+                if type(resource_change["change"]["before_sensitive"]) is dict:
+                    before_sensitive = resource_change["change"]["before_sensitive"]
+
+            after_sensitive = {}
+            if "after_sensitive" in resource_change["change"]:
+                if type(resource_change["change"]["after_sensitive"]) is dict:
+                    after_sensitive = resource_change["change"]["after_sensitive"]
+
+            after_unknown = {}
+            if "after_unknown" in resource_change["change"]:
+                if type(resource_change["change"]["after_unknown"]) is dict:
+                    after_unknown = resource_change["change"]["after_unknown"]
+
+            # Replacement paths are only highlighted for resources that must be replaced
+            replace_paths = []
+            if actions == REPLACE_ACTIONS and "replace_paths" in resource_change["change"]:
+                if type(resource_change["change"]["replace_paths"]) is list:
+                    if resource_change["change"]["replace_paths"]:
+                        replace_paths = resource_change["change"]["replace_paths"][0]
+
+            parts.append(
+                RESOURCE_MESSAGE.format(
+                    resource_change["provider_name"],
+                    resource_change["type"],
+                    resource_change["address"],
+                    message,
+                    symbol,
+                    f'resource "{resource_change["type"]}" "{resource_change["name"]}"',
+                )
+                + "{\n"
+            )
+            compare_values(
+                parts,
+                resource_change["change"]["before"],
+                resource_change["change"]["after"],
+                before_sensitive,
+                after_sensitive,
+                after_unknown,
+                replace_paths,
+            )
+            parts.append("}\n")
+    parts.append("\n")
 
-    return result.lstrip()
+    return "".join(parts).lstrip()
 
 
 # ========= REQUIRED ENVIRONMENT VARIABLES =========
@@ -604,12 +674,48 @@ TF_CLOUD_ORGANIZATION = os.environ.get("TF_CLOUD_ORGANIZATION")
 TF_CLOUD_HOSTNAME = os.environ.get("TF_CLOUD_HOSTNAME", "app.terraform.io")
 
 # Verify SSL when creating client for Terraform Enterprise/Cloud
-TF_VERIFY = eval(str(os.environ.get("TF_VERIFY", True)).capitalize())
+TF_VERIFY = strtobool(os.environ.get("TF_VERIFY", "true"))
+
+# Shared HTTP session; pooled connections amortize TLS handshakes across downloads
+SESSION = requests.Session()
+SESSION.verify = TF_VERIFY
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
 SPECIAL_CHARACTERS_REGEX = re.compile(r"[@!#$%^&*()<>?/\|}{~:]")
 
+INDENTION = IndentionCache()
+
+# Values rendered as nested objects
+CONTAINER_TYPES = (dict, list)
+
+# Placeholder for sensitive values nested within rendered objects
+SENSITIVE_DATA = SensitiveData()
+
+# Placeholder for string values too large to render
+HIDDEN_LARGE_VALUE = "(Hidden Large Value)"
+
+# Value renderers keyed by exact type; other types are rendered as-is
+RENDERERS = {
+    dict: lambda parts, value, indention_level: render_dict(
+        parts, value, start_with_indention=False, indention_level=indention_level
+    ),
+    list: lambda parts, value, indention_level: render_list(
+        parts, value, start_with_indention=False, indention_level=indention_level
+    ),
+    str: lambda parts, value, _: parts.append(
+        HIDDEN_LARGE_VALUE if len(value) > 1000 else '"' + value + '"'
+    ),
+    bool: lambda parts, value, _: parts.append(render_bool(value)),
+    type(None): lambda parts, value, _: parts.append(render_none()),
+}
+
+# Characters any JSON document may begin with (including leading whitespace)
+JSON_LEADING_CHARACTERS = frozenset('{["-0123456789tfn \t\n\r')
+
 SENSITIVE_KEYS = ["auth", "pass", "token", "jwt", "secret"]
 
+SENSITIVE_KEYS_REGEX = re.compile("|".join(map(re.escape, SENSITIVE_KEYS)), re.IGNORECASE)
+
 PARSING_LIBRARY = {
     "add": {"symbol": "+", "message": "This resource will be created as defined."},
     "update": {"symbol": "~", "message": "This resource will be updated in-place."},
@@ -620,6 +726,21 @@ PARSING_LIBRARY = {
     },
 }
 
+ADD_SYMBOL = PARSING_LIBRARY["add"]["symbol"]
+UPDATE_SYMBOL = PARSING_LIBRARY["update"]["symbol"]
+DELETE_SYMBOL = PARSING_LIBRARY["delete"]["symbol"]
+REPLACE_SYMBOL = f"{ADD_SYMBOL}/{DELETE_SYMBOL}"
+
+REPLACE_ACTIONS = frozenset(["create", "delete"])
+
+# Resource message and symbol keyed by set of planned actions
+RESOURCE_ACTIONS = {
+    REPLACE_ACTIONS: ("This resource must be replaced.", REPLACE_SYMBOL),
+    frozenset(["create"]): (PARSING_LIBRARY["add"]["message"], ADD_SYMBOL),
+    frozenset(["delete"]): (PARSING_LIBRARY["delete"]["message"], DELETE_SYMBOL),
+    frozenset(["update"]): (PARSING_LIBRARY["update"]["message"], UPDATE_SYMBOL),
+}
+
 RESOURCE_MESSAGE = """
 # Provider: [{0}]
 # Resource Type: [{1}]
@@ -627,12 +748,26 @@ RESOURCE_MESSAGE = """
 # Message: {3}
 {4} {5} """
 
+# Run-task result summary rendered from task-result attributes
+TASK_TMPL = (
+    "Run Task ID: {task-id}\n"
+    "Run Task Name: {task-name}\n"
+    "Stage: {stage}\n"
+    "Enforcement Level: {workspace-task-enforcement-level}\n"
+    "Status: {status}\n"
+    "Details: {url}\n"
+    "Message:\n\n{message}\n\n"
+)
+
 LOG_LEVEL = logging.INFO
 
 args = parse_arguments()
 terraform = get_tfc_client()
 execution_target = args.execution_target
 
+# Base url for Terraform Enterprise/Cloud links and API requests
+TF_URL = f"https://{terraform.get_hostname()}"
+
 
 @exception_handler
 def main():
@@ -703,51 +838,42 @@ def main():
 
     workspace_name = workspace["data"]["attributes"]["name"]
     resource_count = workspace["data"]["attributes"]["resource-count"]
-    run_link = f"https://{terraform.get_hostname()}/app/{workspace['data']['relationships']['organization']['data']['id']}/workspaces/{workspace['data']['attributes']['name']}/runs/{run['data']['id']}"
+    run_link = f"{TF_URL}/app/{workspace['data']['relationships']['organization']['data']['id']}/workspaces/{workspace['data']['attributes']['name']}/runs/{run['data']['id']}"
     is_cancelable = run["data"]["attributes"]["actions"]["is-cancelable"]
     is_confirmable = run["data"]["attributes"]["actions"]["is-confirmable"]
     is_discardable = run["data"]["attributes"]["actions"]["is-discardable"]
     is_force_cancelable = run["data"]["attributes"]["actions"]["is-force-cancelable"]
 
-    # Open remote url to Plan/Apply execution log and set output for GitHub
-    with open(
-        file=f"{args.path}/{data['id']}-{execution_target}-execution-log-{get_random_string()}.txt",
-        mode="w+t",
-        encoding="utf-8") as tmp:
+    # In event a run encounters an error speculated/applied changes are calculated according to execution log
+    applicable_action = None
+    if any(value is None for value in [to_import, to_add, to_change, to_destroy]):
+        applicable_action = "planned_change" if execution_target == "plan" else "apply_complete"
+
+    # Execution log and Plan JSON output are independent downloads; request both concurrently
+    json_summary = None
+    with ThreadPoolExecutor(max_workers=2) as executor:
         info(f"Downloading Terraform Run execution log...")
-        log = requests.get(
-            url=data["attributes"]["log-read-url"], verify=TF_VERIFY, stream=True
+        execution_log_future = executor.submit(
+            download_execution_log,
+            data["attributes"]["log-read-url"],
+            create_temporary_file(f"{data['id']}-{execution_target}-execution-log-"),
+            applicable_action,
         )
-        log.raise_for_status()
-        tmp.write(log.text)
-        execution_log_file_path = tmp.name
+        plan_json_future = None
+        if execution_target == "plan":
+            info(f"Downloading Terraform {execution_target} JSON output...")
+            plan_json_future = executor.submit(
+                download_plan_json,
+                data["id"],
+                create_temporary_file(f"{data['id']}-{execution_target}-json-output-"),
+            )
+        execution_log_file_path, hook_counts = execution_log_future.result()
+        if plan_json_future is not None:
+            json_summary = plan_json_future.result()
+
+    if hook_counts is not None:
+        to_import, to_add, to_change, to_destroy = hook_counts
 
-        if any(value is None for value in [to_import, to_add, to_change, to_destroy]):
-            to_import, to_add, to_change, to_destroy = (0, 0, 0, 0)
-            applicable_action = "planned_change" if execution_target == "plan" else "apply_complete"
-            for line in log.text.split('\n'):
-                try:
-                    execution_data = json.loads(line)
-                except JSONDecodeError:
-                    continue
-                if "type" not in execution_data:
-                    continue
-                if execution_data['type'] != applicable_action:
-                    continue
-                if "hook" not in execution_data:
-                    continue
-                if "action" not in execution_data['hook']:
-                    continue
-                
-                if execution_data['hook']['action'] == "import":
-                    to_import += 1
-                if execution_data['hook']['action'] == "create":
-                    to_add += 1
-                if execution_data['hook']['action'] == "update":
-                    to_change += 1
-                if execution_data['hook']['action'] == "delete":
-                    to_destroy += 1
-    
     changes = True if any([to_import, to_add, to_change, to_destroy]) else False
     set_output("changes", "true" if changes else "false")
     set_output("resource_count", str(resource_count))
@@ -758,82 +884,58 @@ def main():
 
 
     if execution_target == "plan":
-        # Request additional data from Terraform API to fetch JSON output for Plan
-        with open(
-            file=f"{args.path}/{data['id']}-{execution_target}-json-output-{get_random_string()}.txt",
-            mode="w+t",
-            encoding="utf-8") as tmp:
-            try:
-                info(f"Downloading Terraform {execution_target} JSON output...")
-                terraform.plans.download_json(plan_id=data["id"], target_path=tmp.name)
-                json_summary = json.load(tmp)
-            except TypeError:
-                json_summary = None
-
-        with open(
-            file=f"{args.path}/{data['id']}-{execution_target}-summary-{get_random_string()}.txt",
-            mode="w+t",
-            encoding="utf-8") as tmp:
+        with create_temporary_file(f"{data['id']}-{execution_target}-summary-", mode="w+t", encoding="utf-8") as tmp:
             plan_summary_file_path = tmp.name
             if json_summary:
                 info(f"Interpolating changes derived from Terraform {execution_target} JSON...")
                 tmp.write(parse_changes(json_summary))
 
     if "task-stages" in run["data"]["relationships"]:
-        with open(
-            file=f"{args.path}/{data['id']}-run-tasks-{get_random_string()}.txt",
-            mode="w+t",
-            encoding="utf-8") as tmp:
+        with create_temporary_file(f"{data['id']}-run-tasks-", mode="w+t", encoding="utf-8") as tmp:
             run_tasks_summary_file_path = tmp.name
-            response = requests.get(
-                f"https://{terraform.get_hostname()}{run['data']['relationships']['task-stages']['links']['related']}",
+            response = SESSION.get(
+                f"{TF_URL}{run['data']['relationships']['task-stages']['links']['related']}",
                 headers=terraform._headers,
                 verify=terraform._verify,
             )
             response.raise_for_status()
             task_stages = response.json()
+            task_result_ids = []
             for task_stage in task_stages["data"]:
                 if execution_target == "plan" and task_stage['attributes']['stage'] == "pre_apply":
                     continue
                 if execution_target == "apply" and task_stage['attributes']['stage'] != "pre_apply":
                     continue
                 for task_result in task_stage["relationships"]["task-results"]["data"]:
-                    response = requests.get(
-                        f"https://{terraform.get_hostname()}/api/v2/task-results/{task_result['id']}",
-                        headers=terraform._headers,
-                        verify=terraform._verify,
-                    )
-                    response.raise_for_status()
-                    task_result = response.json()
-                    tmp.write(f"Run Task ID: {task_result['data']['attributes']['task-id']}\n")
-                    tmp.write(f"Run Task Name: {task_result['data']['attributes']['task-name']}\n")
-                    tmp.write(f"Stage: {task_result['data']['attributes']['stage']}\n")
-                    tmp.write(f"Enforcement Level: {task_result['data']['attributes']['workspace-task-enforcement-level']}\n")
-                    tmp.write(f"Status: {task_result['data']['attributes']['status']}\n")
-                    tmp.write(f"Details: {task_result['data']['attributes']['url']}\n")
-                    tmp.write(f"Message:\n\n{task_result['data']['attributes']['message']}\n\n")
+                    task_result_ids.append(task_result["id"])
+
+            # Task results are independent; request concurrently and write in original order
+            task_result_parts = []
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                for task_result in executor.map(get_task_result, task_result_ids):
+                    task_result_parts.append(TASK_TMPL.format_map(task_result["data"]["attributes"]))
+            tmp.write("".join(task_result_parts))
 
     if execution_target == "plan":
         if "policy-checks" in run["data"]["relationships"]:
-            with open(
-                file=f"{args.path}/{data['id']}-policy-checks-{get_random_string()}.txt",
-                mode="w+t",
-                encoding="utf-8") as tmp:
+            with create_temporary_file(f"{data['id']}-policy-checks-") as tmp:
                 policy_check_summary_file_path = tmp.name
-                for policy_check in run["data"]["relationships"]["policy-checks"]["data"]:
-                    policy_check_results = terraform.policy_checks.show(policy_check["id"])["data"]
-                    if "links" in policy_check_results:
-                        if "output" in policy_check_results["links"]:
-                            info(f"Downloading Terraform Run policy check results...")
-                            response = requests.get(
-                                f"https://{terraform.get_hostname()}{policy_check_results['links']['output']}",
-                                headers=terraform._headers,
-                                verify=terraform._verify,
-                            )
-                            response.raise_for_status()
-                            policy_check_summary = response.text
-                            for line in policy_check_summary.split(r"\n"):
-                                tmp.write(line)
+                policy_check_ids = [
+                    policy_check["id"] for policy_check in run["data"]["relationships"]["policy-checks"]["data"]
+                ]
+                # Policy checks are downloaded concurrently to separate files and concatenated in original order
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    policy_check_paths = executor.map(
+                        download_policy_check,
+                        policy_check_ids,
+                        [f"{tmp.name}.{index}" for index in range(len(policy_check_ids))],
+                    )
+                    for policy_check_path in policy_check_paths:
+                        if policy_check_path is None:
+                            continue
+                        with open(file=policy_check_path, mode="rb") as policy_check_output:
+                            shutil.copyfileobj(policy_check_output, tmp)
+                        os.remove(policy_check_path)
 
     result = {
         "run_link": run_link,
@@ -854,8 +956,8 @@ def main():
         "run_tasks_summary_file_path": run_tasks_summary_file_path,
         "policy_check_summary_file_path": policy_check_summary_file_path,
     }
-    info(json.dumps(result, indent=2))
-    sys.stdout.write(json.dumps(result))
+    info(dumps(result, indent=True))
+    sys.stdout.write(dumps(result))
 
 
 if __name__ == "__main__":
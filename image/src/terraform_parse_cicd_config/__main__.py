@@ -21,25 +21,32 @@ Usage:
     terraform-parse-cicd-config --target-branch <TARGET_BRANCH>
     terraform-parse-cicd-config --deployment-id <INPUT_DEPLOYMENT_ID> --environment-name <ENVIRONMENT_NAME>
 
+Optionally a JSON rendition of the configuration file may be committed alongside it to skip YAML parsing.
+The rendition records a SHA-256 digest of the YAML it was built from and is ignored once the YAML changes:
+    python -c "import hashlib, json, yaml; c = open('.terraform-cicd-config.yaml', 'rb').read(); json.dump({'sha256': hashlib.sha256(c).hexdigest(), 'config': yaml.safe_load(c)}, open('.terraform-cicd-config.yaml.json', 'w'))"
+
 """
 
 __author__ = "Noah Eldreth"
 __version__ = "1.0.0"
 
 import functools
+import hashlib
+import os
 import re
 import sys
 import cfgv
 import yaml
-import json
+from yaml import CSafeLoader as LOADER, CSafeDumper as DUMPER
 import argparse
 import logging
 import logging.config
 from typing import Any
-from utilities.constants import TF_CICD_CONFIG_FILE
-from utilities.logging import info, debug, error
+from utilities.constants import TF_CICD_CONFIG_FILE, TF_CICD_CONFIG_CACHE_FILE
+from utilities.logging import info, debug, warning, error
 from utilities.exception_handler import exception_handler
 from utilities.github_actions import set_output
+from utilities.serialization import dumps, dumps_bytes, load_file, JSONDecodeError
 
 
 def parse_arguments():
@@ -96,10 +103,119 @@ def yaml_dump(o: Any, **kwargs: Any) -> str:
     )
 
 
+def get_config_digest():
+    """
+    SHA-256 digest of configuration file contents.
+
+    Returns:
+        str: Hex digest; None if configuration file cannot be read.
+    """
+    try:
+        with open(TF_CICD_CONFIG_FILE, "rb") as config_file:
+            return hashlib.sha256(config_file.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def load_config(digest):
+    """
+    Load and validate configuration file. A JSON rendition of the file is preferred when present
+    and its recorded digest matches the YAML contents; schema defaults are applied either way.
+
+    Args:
+        digest (str): SHA-256 digest of configuration file contents; None if unreadable.
+
+    Returns:
+        dict: Validated configuration.
+    """
+    try:
+        rendition = load_file(TF_CICD_CONFIG_CACHE_FILE)
+    except (OSError, JSONDecodeError):
+        rendition = None
+    if digest and isinstance(rendition, dict):
+        if rendition.get("sha256") == digest:
+            debug(f"Loading configuration from [{TF_CICD_CONFIG_CACHE_FILE}]")
+            with cfgv.validate_context(f"File {TF_CICD_CONFIG_CACHE_FILE}"):
+                cfgv.validate(rendition.get("config"), CONFIG_SCHEMA)
+                return cfgv.apply_defaults(rendition["config"], CONFIG_SCHEMA)
+        warning(f"[{TF_CICD_CONFIG_CACHE_FILE}] does not match [{TF_CICD_CONFIG_FILE}] and is ignored. Regenerate or remove it.")
+    return CONFIG_LOADER(TF_CICD_CONFIG_FILE)
+
+
+def get_config_cache_path(digest):
+    """
+    Path of parsed configuration cache; keyed by resolved path and content digest of configuration file.
+
+    Args:
+        digest (str): SHA-256 digest of configuration file contents; None if unreadable.
+
+    Returns:
+        str: Cache file path; None if configuration file is missing or RUNNER_TEMP is unset.
+    """
+    # Cache is only kept in the runner's private temporary directory, never in shared system temp
+    if digest is None or RUNNER_TEMP is None:
+        return None
+    key = hashlib.sha256(f"{os.path.realpath(TF_CICD_CONFIG_FILE)}\0{digest}".encode("utf-8")).hexdigest()
+    return os.path.join(RUNNER_TEMP, f"tfcicd_{key}.json")
+
+
+def load_config_cache(path):
+    """
+    Load configuration from cache. Cached configuration is validated again before use;
+    a missing, unreadable or invalid cache is treated as a miss.
+
+    Returns:
+        dict: Validated configuration; None on cache miss.
+    """
+    try:
+        config = load_file(path)
+        cfgv.validate(config, CONFIG_SCHEMA)
+        check_environment_in_lifecycle(config=config)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, cfgv.ValidationError) as exception:
+        debug(f"Ignoring cached configuration at [{path}]: {exception}")
+        return None
+    debug(f"Loaded cached configuration from [{path}]")
+    return config
+
+
+def write_config_cache(path, config):
+    """
+    Write validated configuration to cache. Replaced atomically so concurrent readers never observe a partial file.
+    Failure to cache is not fatal; configuration is simply parsed again on next invocation.
+    """
+    partial_path = f"{path}.{os.getpid()}"
+    try:
+        data = dumps_bytes(config)
+        with open(partial_path, "wb") as cache:
+            cache.write(data)
+        os.replace(partial_path, path)
+    except (OSError, TypeError, ValueError) as exception:
+        debug(f"Unable to cache configuration at [{path}]: {exception}")
+        try:
+            os.remove(partial_path)
+        except OSError:
+            pass
+
+
+def compile_branch_patterns(config):
+    """
+    Compile branch patterns of each lifecycle stage once.
+
+    Returns:
+        list: Lifecycle stage name and compiled branch patterns, in order of definition.
+    """
+    return [
+        (lifecycle_stage["name"], [re.compile(pattern) for pattern in lifecycle_stage["branches"]])
+        for lifecycle_stage in config["lifecycle"]
+    ]
+
+
 def check_environment_in_lifecycle(config):
-    valid_lifecycle_stages = [
+    valid_lifecycle_stages = {
         lifecycle_stage["name"] for lifecycle_stage in config["lifecycle"]
-    ]
+    }
     for deployment in config["deployments"]:
         for environment in deployment["environments"]:
             if environment["name"] not in valid_lifecycle_stages:
@@ -108,9 +224,7 @@ def check_environment_in_lifecycle(config):
                 )
             
 
-LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 YAML_LOAD = functools.partial(yaml.load, Loader=LOADER)
-DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 # [backend] section
 BACKEND_SCHEMA = cfgv.Map(
@@ -182,14 +296,23 @@ CONFIG_LOADER = functools.partial(
     exc_tp=cfgv.ValidationError,
 )
 
+# Runner temporary directory; parsed configuration is cached here across invocations when set
+RUNNER_TEMP = os.environ.get("RUNNER_TEMP")
+
 args = parse_arguments()
 
 @exception_handler
 def main():
     try:
-        # Load the configuration file
-        config = CONFIG_LOADER(TF_CICD_CONFIG_FILE)
-        check_environment_in_lifecycle(config=config)
+        # Load the configuration file; validated configuration is cached for subsequent invocations
+        digest = get_config_digest()
+        cache_path = get_config_cache_path(digest)
+        config = load_config_cache(cache_path) if cache_path else None
+        if config is None:
+            config = load_config(digest)
+            check_environment_in_lifecycle(config=config)
+            if cache_path:
+                write_config_cache(cache_path, config)
     except cfgv.ValidationError as confg_err:
         error(
             f"""[{TF_CICD_CONFIG_FILE}] is NOT valid. Review the following error(s):
@@ -204,24 +327,22 @@ def main():
         target_branch = args.target_branch
         # Get the list of deployments and lifecycle stages
         deployments = [deployment["id"] for deployment in config["deployments"]]
+        # Branch patterns are matched from start of branch name (partial match permitted)
         lifecycle_stages = [
-            lifecycle_stage["name"]
-            for lifecycle_stage in config["lifecycle"]
-            if any(
-                re.match(pattern, target_branch)
-                for pattern in lifecycle_stage["branches"]
-            )
+            name
+            for name, patterns in compile_branch_patterns(config)
+            if any(pattern.match(target_branch) for pattern in patterns)
         ]
 
         # Set the GitHub Action output
-        set_output("config", str(config))
+        set_output("config", dumps(config))
         set_output("backend_hostname", config["backend"]["hostname"])
         set_output("backend_organization", config["backend"]["organization"])
         set_output("backend_project", config["backend"]["project"])
-        set_output("deployments", json.dumps(deployments))
-        set_output("lifecycle_stages", json.dumps(lifecycle_stages))
+        set_output("deployments", dumps(deployments))
+        set_output("lifecycle_stages", dumps(lifecycle_stages))
 
-        sys.stdout.write(f"{json.dumps(config, indent=2)}\n")
+        sys.stdout.buffer.write(dumps_bytes(config, indent=True) + b"\n")
 
     if args.deployment_id:
         # Additional Variables for a specific deployment/environment
@@ -229,28 +350,21 @@ def main():
         environment_name = args.environment_name
 
         # Get config for deployment and lifecycle stage
-        try:
-            deployment = [
-                deployment
-                for deployment in config["deployments"]
-                if deployment["id"] == deployment_id
-            ][0]
-        except IndexError:
+        # Built in reverse so the first definition of a duplicated id/name takes precedence
+        deployments_by_id = {deployment["id"]: deployment for deployment in reversed(config["deployments"])}
+        deployment = deployments_by_id.get(deployment_id)
+        if deployment is None:
             error(f"Deployment [{deployment_id}] is MISSING from [{TF_CICD_CONFIG_FILE}].")
             sys.exit(1)
-        try:
-            environment = [
-                environment
-                for environment in deployment["environments"]
-                if environment["name"] == environment_name
-            ][0]
-        except IndexError:
+        environments_by_name = {environment["name"]: environment for environment in reversed(deployment["environments"])}
+        environment = environments_by_name.get(environment_name)
+        if environment is None:
             error(
                 f"Environment [{environment_name}] is MISSING from [{TF_CICD_CONFIG_FILE}] for deployment [{deployment_id}] under field: [environments]."
             )
             sys.exit(1)
-        debug(json.dumps(deployment, indent=4, sort_keys=False))
-        debug(json.dumps(environment, indent=4, sort_keys=False))
+        debug(dumps(deployment, indent=True))
+        debug(dumps(environment, indent=True))
 
         # Set the GitHub Action output
         workspace = "-".join([deployment["workspace-prefix"], environment["name"]]).upper()
@@ -263,10 +377,10 @@ def main():
         set_output("working_directory", deployment["working-directory"])
         set_output("execution_mode", deployment["execution-mode"])
         set_output("var_file", environment["var-file"])
-        set_output("environment_variables", json.dumps(environment_variables))
-        set_output("secrets", json.dumps(secrets))
+        set_output("environment_variables", dumps(environment_variables))
+        set_output("secrets", dumps(secrets))
         
-        sys.stdout.write(f"{json.dumps({'deployment': deployment, 'environment': environment}, indent=2)}\n")
+        sys.stdout.write(f"{dumps({'deployment': deployment, 'environment': environment}, indent=True)}\n")
 
 
 if __name__ == "__main__":
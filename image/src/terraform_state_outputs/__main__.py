@@ -19,14 +19,18 @@ __version__ = "1.0.0"
 
 import sys
 import json
+import functools
 import argparse
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from terrasnek.api import TFC
 from terrasnek.exceptions import TFCException
 from utilities.logging import info, debug, error
 from utilities.exception_handler import exception_handler
 from utilities.github_actions import set_output
+from utilities.serialization import dumps
+from utilities.environment import strtobool
 
 
 # ======================================= FUNCTIONS ========================================
@@ -99,7 +103,7 @@ TF_CLOUD_HOSTNAME = os.environ.get("TF_CLOUD_HOSTNAME", "app.terraform.io")
 TF_CLOUD_ORGANIZATION = os.environ.get("TF_CLOUD_ORGANIZATION", None)
 
 # Verify SSL when creating client for Terraform Enterprise/Cloud
-TF_VERIFY = eval(str(os.environ.get("TF_VERIFY", True)).capitalize())
+TF_VERIFY = strtobool(os.environ.get("TF_VERIFY", "true"))
 
 LOG_LEVEL = logging.INFO
 
@@ -129,27 +133,36 @@ def main():
         error(f"Unable to acquire apply from Terraform Run [{run['data']['id']}]")
         sys.exit(1)
 
-    try:
-        state_version = terraform.state_versions.show(apply['relationships']['state-versions']['data'][0]['id'])['data']
-    except IndexError:
+    state_versions = apply['relationships']['state-versions']['data']
+    if state_versions:
+        state_version = terraform.state_versions.show(state_versions[0]['id'])['data']
+    else:
         debug(f"Unable to acquire state-version from Terraform Run [{run['data']['id']}]")
         state_version = terraform.state_versions.get_current(workspace_id=run['data']['relationships']['workspace']['data']['id'])['data']
 
-    state_outputs = None
-    state_outputs_all = {}
-    while not state_outputs or state_outputs['meta']['pagination']['next-page']:
-        state_outputs = terraform.state_version_outputs.list(
-            state_version['id'],
-            page=state_outputs['meta']['pagination']['next-page']
-            if state_outputs
-            and state_outputs['meta']['pagination']['next-page'] else None)
-        for state_output in state_outputs['data']:
-            if not state_output['attributes']['sensitive']:
-                state_outputs_all[state_output['attributes']['name']] = state_output['attributes']['value']
-
-    info(json.dumps(state_outputs_all, indent=2))
-    set_output("state_version_outputs", f"{json.dumps(state_outputs_all)}")
-    sys.stdout.write(json.dumps(state_outputs_all, indent=2))
+    # Remaining pages are requested concurrently once total page count is known
+    state_outputs = terraform.state_version_outputs.list(state_version['id'], page=1)
+    pages = [state_outputs]
+    total_pages = state_outputs['meta']['pagination']['total-pages']
+    if total_pages > 1:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            pages.extend(
+                executor.map(
+                    functools.partial(terraform.state_version_outputs.list, state_version['id']),
+                    range(2, total_pages + 1),
+                )
+            )
+
+    state_outputs_all = {
+        state_output['attributes']['name']: state_output['attributes']['value']
+        for state_outputs in pages
+        for state_output in state_outputs['data']
+        if not state_output['attributes']['sensitive']
+    }
+
+    info(dumps(state_outputs_all, indent=True))
+    set_output("state_version_outputs", dumps(state_outputs_all))
+    sys.stdout.write(dumps(state_outputs_all, indent=True))
 
 if __name__ == "__main__":
     sys.exit(main())
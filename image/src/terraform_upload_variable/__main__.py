@@ -15,7 +15,7 @@ Usage:
         --organization <TFE/C ORGANIZATION> \
         --verify <USE TLS/SSL IN CONNECTION TO TARGET TFE/C HOSTNAME: TRUE OR FALSE> \
         --workspace <TFE/C WORKSPACE> \
-        --var-file <PATH TO VARIABLES FILE> \
+        --var-file <PATH TO VARIABLES FILE> [--var-file <PATH TO VARIABLES FILE> ...] \
         --type <WORKSPACE VARIABLE TYPE: ENV OR TERRAFORM>
 
 """
@@ -24,16 +24,20 @@ __author__ = "Noah Eldreth"
 __version__ = "1.0.0"
 
 import sys
+import re
 import json
 import argparse
 import os
 import logging
-from json import JSONDecodeError
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import hcl2
 from terrasnek.api import TFC
-from terrasnek.exceptions import TFCException, TFCHTTPNotFound, TFCHTTPUnprocessableEntity
+from terrasnek.exceptions import TFCException, TFCHTTPNotFound, TFCHTTPAPIRequestRateLimit
 from utilities.logging import info, debug, error
 from utilities.exception_handler import exception_handler
+from utilities.serialization import loads, dumps, JSONDecodeError
+from utilities.environment import strtobool
 
 
 # ======================================= FUNCTIONS ========================================
@@ -71,8 +75,9 @@ def parse_arguments():
     )
     parser.add_argument(
         "--var-file",
-        dest="var_file",
-        help="Relative path to *.json file to load run-specific variables.",
+        dest="var_files",
+        action="append",
+        help="Relative path to *.json file to load run-specific variables. May be repeated.",
         default=None,
     )
     parser.add_argument(
@@ -108,6 +113,68 @@ def get_tfc_client():
     return terraform
 
 
+def load_variables(path):
+    """
+    Load variables from file; parsed as JSON or otherwise HCL.
+
+    Args:
+        path (str): Path to variable file.
+
+    Returns:
+        dict: Variables keyed by name.
+    """
+    # Read as bytes; JSON is decoded directly without an intermediate str
+    with open(file=path, mode="rb") as var_file:
+        content = var_file.read()
+    try:
+        variables = loads(content)
+    except JSONDecodeError:
+        debug(f"File at path [{path}] is not valid JSON. Attempting to parse as HCL")
+        try:
+            variables = hcl2.loads(content.decode("utf-8"))
+        except:
+            variables = None
+
+    if type(variables) is not dict:
+        error(f"Unable to pare variable file at [{path}]. Expected valid JSON or HCL file.")
+        debug(str(variables))
+        sys.exit(1)
+    return variables
+
+
+def upload_variable(workspace_id, key, payload, variable_id=None):
+    """
+    Create or update a workspace variable. Rate limited requests are retried with exponential backoff.
+
+    Args:
+        workspace_id (str): Terraform workspace-id.
+        key (str): Variable name.
+        payload (dict): Variable request body.
+        variable_id (str): Id of existing workspace variable to update; created if not provided.
+    """
+    for attempt in range(UPLOAD_ATTEMPTS):
+        try:
+            if variable_id:
+                debug(f"Updating value for workspace variable [{key}]...")
+                try:
+                    terraform.workspace_vars.update(workspace_id, variable_id, payload)
+                except TFCHTTPAPIRequestRateLimit:
+                    raise
+                except TFCException:
+                    terraform.workspace_vars.destroy(workspace_id, variable_id)
+                    # Retries following destruction must re-create the variable
+                    variable_id = None
+                    terraform.workspace_vars.create(workspace_id, payload)
+            else:
+                debug(f"Creating workspace variable [{key}]...")
+                terraform.workspace_vars.create(workspace_id, payload)
+            return
+        except TFCHTTPAPIRequestRateLimit:
+            if attempt == UPLOAD_ATTEMPTS - 1:
+                raise
+            time.sleep(2**attempt)
+
+
 # ============================= REQUIRED ENVIRONMENT VARIABLES =============================
 # URL directing back to Octopus Project/GitHub Repository/etc
 # Friendly name for 'SOURCE_URL'
@@ -128,7 +195,7 @@ TF_CLOUD_ORGANIZATION = os.environ.get("TF_CLOUD_ORGANIZATION", None)
 TF_WORKSPACE = os.environ.get("TF_WORKSPACE", None)
 
 # Verify SSL when creating client for Terraform Enterprise/Cloud
-TF_VERIFY = eval(str(os.environ.get("TF_VERIFY", True)).capitalize())
+TF_VERIFY = strtobool(os.environ.get("TF_VERIFY", "true"))
 
 LOG_LEVEL = logging.INFO
 
@@ -144,86 +211,83 @@ if args.workspace:
 if args.tf_verify:
     TF_VERIFY = args.tf_verify
 
-VAR_FILE = str(args.var_file).replace("\\", "/")
+VAR_FILES = [var_file.replace("\\", "/") for var_file in args.var_files or []]
 
 VAR_TYPE = args.type
 
+# Concurrent variable uploads; bounded to stay within Terraform API rate limits
+UPLOAD_WORKERS = 8
+UPLOAD_ATTEMPTS = 3
+
 # Terraform Variable Key Substrings That Require Sensitive Visibility
 TF_VAR_SENSITIVE_KEYS = ["auth", "pass", "cred", "token", "jwt", "secret", "license"]
 
+TF_VAR_SENSITIVE_KEYS_REGEX = re.compile("|".join(map(re.escape, TF_VAR_SENSITIVE_KEYS)), re.IGNORECASE)
+
 terraform = get_tfc_client()
 
 @exception_handler
 def main():
-    if VAR_FILE and VAR_FILE != "":
+    if VAR_FILES:
         try:
             workspace = terraform.workspaces.show(TF_WORKSPACE)["data"]
         except TFCHTTPNotFound as exception:
             error(str(exception))
             sys.exit(1)
 
-        with open(file=VAR_FILE, mode="r", encoding="utf-8") as var_file:
-            content = var_file.read()
-        try:
-            variables = json.loads(content)
-        except JSONDecodeError:
-            debug(f"File at path [{VAR_FILE}] is not valid JSON. Attempting to parse as HCL")
-            try:
-                variables = hcl2.loads(content)
-            except: 
-                error(f"Unable to pare variable file at [{VAR_FILE}]. Expected valid JSON or HCL file.")
-
-        if type(variables) is not dict:
-            error(f"Unable to pare variable file at [{VAR_FILE}]. Expected valid JSON or HCL file.")
-            debug(str(variables))
-            sys.exit(1)
+        # Variable files are merged in order given; later files take precedence
+        variables = {}
+        for path in VAR_FILES:
+            variables.update(load_variables(path))
+
+        # Existing variables of target category keyed by name; updated in place rather than re-created
+        existing_variables = {
+            workspace_variable["attributes"]["key"]: workspace_variable["id"]
+            for workspace_variable in terraform.workspace_vars.list(workspace["id"])["data"]
+            if workspace_variable["attributes"]["category"] == VAR_TYPE
+        }
 
+        uploads = []
         for key, value in variables.items():
             info(f"Exporting variable '{key}'")
-            if (
-                isinstance(value, dict)
-                or isinstance(value, list)
-                or isinstance(value, bool)
-            ):
+            upload_as_hcl = isinstance(value, (dict, list, bool))
+            if upload_as_hcl:
                 debug(f"Variable [{key}] of type [{type(value)}] is valid JSON.")
-                upload_as_hcl = True
             else:
                 debug(f"Variable [{key}] of type [{type(value)}] is NOT JSON.")
-                upload_as_hcl = False
             payload = {
                 "data": {
                     "type": "vars",
                     "attributes": {
                         "key": key,
-                        "value": json.dumps(value) if upload_as_hcl else str(value),
+                        "value": dumps(value) if upload_as_hcl else str(value),
                         "category": VAR_TYPE,
-                        "hcl": True if upload_as_hcl else False,
-                        "sensitive": True
-                        if any(check in key.lower() for check in TF_VAR_SENSITIVE_KEYS)
-                        else False,
+                        "hcl": upload_as_hcl,
+                        "sensitive": TF_VAR_SENSITIVE_KEYS_REGEX.search(key) is not None,
                     },
                 }
             }
-            try:
-                debug(f"Creating workspace variable [{key}]...")
-                terraform.workspace_vars.create(workspace["id"], payload)
-            except TFCHTTPUnprocessableEntity:
-                workspace_variables = terraform.workspace_vars.list(workspace["id"])[
-                    "data"
-                ]
-                for workspace_variable in workspace_variables:
-                    if workspace_variable["attributes"]["key"] == key:
-                        debug(f"Updating value for workspace variable [{key}]...")
-                        try:
-                            terraform.workspace_vars.update(
-                                workspace["id"], workspace_variable["id"], payload
-                            )
-                        except TFCException:
-                            terraform.workspace_vars.destroy(
-                                workspace["id"], workspace_variable["id"]
-                            )
-                            terraform.workspace_vars.create(workspace["id"], payload)
-                        break
+            uploads.append((key, payload))
+
+        # Variables are independent; upload concurrently
+        failed = False
+        with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    upload_variable, workspace["id"], key, payload, existing_variables.get(key)
+                ): key
+                for key, payload in uploads
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except TFCException as exception:
+                    error(f"Failed to upload workspace variable [{futures[future]}]: {exception}")
+                    failed = True
+                else:
+                    debug(f"Uploaded workspace variable [{futures[future]}]")
+        if failed:
+            sys.exit(1)
 
 
 if __name__ == "__main__":
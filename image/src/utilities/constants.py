@@ -3,4 +3,7 @@ Constants/default values for Python source code.
 
 """
 
-TF_CICD_CONFIG_FILE = ".terraform-cicd-config.yaml"
\ No newline at end of file
+TF_CICD_CONFIG_FILE = ".terraform-cicd-config.yaml"
+
+# Optional pre-built JSON rendition of [TF_CICD_CONFIG_FILE]; preferred when its recorded digest matches the YAML
+TF_CICD_CONFIG_CACHE_FILE = f"{TF_CICD_CONFIG_FILE}.json"
@@ -0,0 +1,16 @@
+"""
+Helpers for reading runner/environment configuration.
+
+"""
+
+from typing import Any
+
+# Values accepted as false; anything else (including empty or unrecognised values) is treated as true
+FALSE_VALUES = ("0", "false", "no", "off")
+
+
+def strtobool(value: Any) -> bool:
+    """
+    Interpret a boolean flag. Fails closed: only a recognised false value disables the flag.
+    """
+    return str(value).strip().lower() not in FALSE_VALUES
@@ -3,48 +3,60 @@
 This module hosts utility functions useful in promoting workflow updates to GitHub Actions.
 """
 
+import atexit
 import os
 import random
 import string
 from pathlib import Path
 from typing import Any
 
+# Open GitHub Actions command files keyed by path; held for life of process and closed at exit
+COMMAND_FILES = {}
+
+
 # Required for multiline strings; reference: https://docs.github.com/en/actions/using-workflows/workflow-commands-for-github-actions#multiline-strings
 def generate_delimiter():
     return "".join(random.choice(string.ascii_lowercase) for _ in range(20))
 
 
+def _format_kv(name: str, value: Any) -> str:
+    """
+    Format name/value pair for a GitHub Actions command file; multiline values are wrapped in a delimiter.
+    """
+    if len(value.splitlines()) > 1:
+        delimiter = generate_delimiter()
+        if not value.endswith("\n"):
+            value += "\n"
+        return f"{name}<<{delimiter}\n{value}{delimiter}\n"
+    return f"{name}={value}\n"
+
+
+def _append_kv(environment_variable: str, name: str, value: Any) -> None:
+    """
+    Append name/value pair to GitHub Actions command file referenced by environment variable.
+    File is opened on first use and kept open until process exit.
+    """
+    path = os.environ.get(environment_variable)
+    if path is None:
+        return
+    command_file = COMMAND_FILES.get(path)
+    if command_file is None:
+        if not Path(path).is_file():
+            return
+        command_file = COMMAND_FILES[path] = open(path, "a")
+        atexit.register(command_file.close)
+    command_file.write(_format_kv(name, value))
+
+
 def set_output(name: str, value: Any) -> None:
     """
     Set GitHub Actions Step Output.
     """
-    if "GITHUB_OUTPUT" in os.environ and Path(os.environ["GITHUB_OUTPUT"]).is_file():
-        with open(os.environ["GITHUB_OUTPUT"], "a") as output:
-            if len(value.splitlines()) > 1:
-                delimiter = generate_delimiter()
-                output.write(f"{name}<<{delimiter}\n")
-                output.write(value)
-
-                if not value.endswith("\n"):
-                    output.write("\n")
-                output.write(f"{delimiter}\n")
-            else:
-                output.write(f"{name}={value}\n")
+    _append_kv("GITHUB_OUTPUT", name, value)
 
 
 def set_environment_variable(name: str, value: Any) -> None:
     """
     Set GitHub Actions Job Environment Variable.
     """
-    if "GITHUB_ENV" in os.environ and Path(os.environ["GITHUB_ENV"]).is_file():
-        with open(os.environ["GITHUB_ENV"], "a") as output:
-            if len(value.splitlines()) > 1:
-                delimiter = generate_delimiter()
-                output.write(f"{name}<<{delimiter}\n")
-                output.write(value)
-
-                if not value.endswith("\n"):
-                    output.write("\n")
-                output.write(f"{delimiter}\n")
-            else:
-                output.write(f"{name}={value}\n")
+    _append_kv("GITHUB_ENV", name, value)
@@ -3,32 +3,71 @@
 This module is used to standardize logging output to be best represented by GitHub Actions UI.
 """
 
-import sys
+from os import write as os_write
+
+# Messages are written directly to the stderr file descriptor, bypassing the sys.stderr text wrapper;
+# os.write is imported by name so each call resolves a single global
+STDERR_FD = 2
+
+
+def _write(data: bytes) -> None:
+    """Write bytes to stderr in full; os.write may accept only part of a large message."""
+
+    while data:
+        data = data[os_write(STDERR_FD, data) :]
+
+
+def _emit(prefix: bytes, msg: str) -> None:
+    """Write each line of a message to stderr behind a workflow command prefix."""
+
+    # Common case of a single line; printable strings hold no line boundaries
+    if msg and msg.isprintable():
+        _write(prefix + msg.encode("utf-8", "backslashreplace") + b"\n")
+        return
+    # Lines separated only by "\n" are prefixed with a single replace; a trailing newline ends the last line
+    body = msg[:-1] if msg.endswith("\n") else msg
+    if msg and body.replace("\n", "").isprintable():
+        _write(prefix + body.encode("utf-8", "backslashreplace").replace(b"\n", b"\n" + prefix) + b"\n")
+        return
+    _write(b"".join(prefix + line.encode("utf-8", "backslashreplace") + b"\n" for line in msg.splitlines()))
+
+
+def _annotate(prefix: bytes, msg: str) -> None:
+    """Write a message to stderr as a single workflow annotation; line breaks are escaped as %0A."""
+
+    # Workflow command data escapes "%" so literal sequences such as "%0A" are not decoded by the runner
+    data = msg.replace("%", "%25")
+    if not data.isprintable():
+        data = "%0A".join(data.splitlines())
+    if data:
+        _write(prefix + data.encode("utf-8", "backslashreplace") + b"\n")
 
 
 def info(msg: str) -> None:
     """Add a message to the actions info log."""
 
-    for line in msg.splitlines():
-        sys.stderr.write(f"{line}\n")
+    _emit(b"", msg)
 
 
 def debug(msg: str) -> None:
     """Add a message to the actions debug log."""
 
-    for line in msg.splitlines():
-        sys.stderr.write(f"::debug::{line}\n")
+    _emit(b"::debug::", msg)
+
+
+def debug_line(msg: str) -> None:
+    """Add a single-line message to the actions debug log; use debug() for messages that may span lines."""
+
+    _write(b"::debug::" + msg.encode("utf-8", "backslashreplace") + b"\n")
 
 
 def warning(msg: str) -> None:
     """Add a warning message to the workflow log."""
 
-    for line in msg.splitlines():
-        sys.stderr.write(f"::warning::{line}\n")
+    _annotate(b"::warning::", msg)
 
 
 def error(msg: str) -> None:
     """Add a warning message to the error log."""
 
-    for line in msg.splitlines():
-        sys.stderr.write(f"::error::{line}\n")
+    _annotate(b"::error::", msg)
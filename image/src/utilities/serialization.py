@@ -0,0 +1,57 @@
+"""
+JSON serialization helpers. Prefers C-accelerated [orjson] when installed; falls back to standard library [json].
+
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# [orjson.JSONDecodeError] subclasses [json.JSONDecodeError]; callers may catch either
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Deserialize JSON document from bytes or str.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize object to UTF-8 encoded JSON; optionally indented by two spaces.
+    """
+    if orjson is not None:
+        # Non-string keys (e.g. YAML int/bool keys) are stringified as [json.dumps] does
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(
+        data,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def dumps(data: Any, indent: bool = False) -> str:
+    """
+    Serialize object to JSON string; optionally indented by two spaces.
+    """
+    return dumps_bytes(data, indent=indent).decode("utf-8")
+
+
+def load_file(path: str) -> Any:
+    """
+    Deserialize JSON document from file with a single unbuffered read.
+    """
+    with open(path, "rb", buffering=0) as file:
+        return loads(file.read())
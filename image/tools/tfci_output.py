@@ -6,43 +6,72 @@ Last output to stdout is a multi-line JSON object. Execution expects a file with
 
 import os
 import sys
-import re
-
-
-def debug(msg: str) -> None:
-    for line in msg.splitlines():
-        sys.stderr.write(f"::debug::{line}\n")
-
-def tail_file(path, number):
-    assert number >= 0
-    pos = number + 1
-    lines = []
-    with open(path) as f:
-        while len(lines) <= number:
-            try:
-                f.seek(-pos, 2)
-            except IOError:
-                f.seek(0)
-                break
-            finally:
-                lines = list(f)
-            pos *= 2
-             
-    return lines[-number:]
-
-def tfci_output(path: str):
-    expression = re.compile(r"{\n(?:.*\n?)+}")
+from collections import deque
+from utilities.logging import debug_line
 
+# Bytes read from end of file to locate trailing lines (~50 lines of tfci output)
+TAIL_BLOCK_SIZE = 8192
+TAIL_BUFFER_SIZE = 65536
+TAIL_SMALL_FILE_SIZE = 65536
+
+# Final tfci JSON object is expected under 256 KB; bounds the extraction scan when trailing lines are very long
+JSON_WINDOW_SIZE = 262144
+
+
+def tail_file(f, number):
+    if number < 0:
+        raise ValueError(f"Expected non-negative number of lines [{number}].")
+    size = os.fstat(f.fileno()).st_size
+    # Small files are read whole in one pass
+    block = size if size <= TAIL_SMALL_FILE_SIZE else TAIL_BLOCK_SIZE
+    # Single read of trailing block; doubled once if it holds too few lines
+    for _ in range(2):
+        f.seek(max(0, size - block))
+        buf = f.read()
+        if buf.count(b"\n") > number or block >= size:
+            break
+        block *= 2
+    else:
+        # Lines outgrew trailing block; stream file retaining only last lines in memory
+        f.seek(0)
+        buf = b"".join(deque(f, maxlen=number))
+
+    # Offset of last lines located in place; buffer is sliced once rather than split into a list
+    pos = len(buf) - 1 if buf.endswith(b"\n") else len(buf)
+    for _ in range(number):
+        pos = buf.rfind(b"\n", 0, pos)
+        if pos < 0:
+            break
+    return buf[pos + 1 :]
+
+def tfci_output(path_or_fp):
     try:
-        debug("Evaluating Output...")
-        data = "\n".join(tail_file(path, 50))
-        matches = re.findall(expression, data)
-        result = matches[0]
+        debug_line("Evaluating Output...")
+        # Accepts path or open binary file; open file may be reused across calls by importing callers
+        if isinstance(path_or_fp, (str, os.PathLike)):
+            with open(path_or_fp, "rb", buffering=TAIL_BUFFER_SIZE) as f:
+                data = tail_file(f, 50)
+        else:
+            data = tail_file(path_or_fp, 50)
+        data = data[-JSON_WINDOW_SIZE:]
+        # Multi-line JSON object is last output; scan back from its closing brace to the top-level opener,
+        # a lone "{" at start of line (nested openers are indented or follow a key)
+        end = data.rfind(b"}")
+        if end < 0:
+            raise IndexError
+        start = data.rfind(b"\n{\n", 0, end) + 1
+        if not start and not data.startswith(b"{\n"):
+            # No top-level opener; fall back to first opener in window
+            start = data.find(b"{\n", 0, end)
+            if start < 0:
+                raise IndexError
+        # Only extracted object is decoded
+        result = data[start : end + 1].decode("utf-8", "replace")
     except IndexError:
         sys.stderr.write("Failed to Extract JSON.\n")
         sys.exit(1)
     except FileNotFoundError:
-        sys.stderr.write(f"File Not Found [{path}].\n")
+        sys.stderr.write(f"File Not Found [{path_or_fp}].\n")
         sys.exit(1)
     sys.stdout.write(result)
     return